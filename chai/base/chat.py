@@ -46,13 +46,13 @@ class Chat(ABC):
         """Send a message to the model and stream the response."""
         self._history.append(Message(role="user", content=message))
 
-        full_content = ""
+        contents: list[str] = []
 
         for content in self._send(message):
-            full_content += content
+            contents.append(content)
             yield content
 
-        self._history.append(Message(role="assistant", content=full_content))
+        self._history.append(Message(role="assistant", content="".join(contents)))
 
     @abstractmethod
     def _send(self, message: str) -> Generator[str, None, None]:
@@ -12,6 +12,7 @@
 
 import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 
 from .chat import Chat
 
@@ -53,6 +54,11 @@ class Provider(ABC):
         except Exception as e:
             raise RuntimeError(f"Error getting models: {e}")
 
+    @cached_property
+    def sorted_models(self) -> list[str]:
+        """The sorted list of available models, fetched once per provider."""
+        return sorted(self.models)
+
     @abstractmethod
     def _get_models(self) -> list[str]:
         """Return the provider-specific list of available models."""
@@ -10,22 +10,41 @@
 # ANY KIND, either express or implied.  See the License for the specific language
 # governing permissions and limitations under the License.
 
-import argparse
-import readline
+import os
+import re
 import signal
+import sys
+import threading
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.spinner import Spinner as RichSpinner
-
+from . import __version__
 from .base.chat import Chat
-from .providers.providers import get_provider, get_providers
 from .spinner import Spinner
 
+if TYPE_CHECKING:
+    import argparse
+
+    from rich.console import Console, RenderableType
+
 MULTI_LINE_INPUT = '"""'
 
+# Number of streamed chunks between output flushes and stop checks.
+CHUNK_BATCH = 8
+
+# Buffered plain output size that triggers a write.
+WRITE_BUFFER_SIZE = 4096
+
+# Blocks that Rich already renders with a leading blank line.
+SELF_SPACED_BLOCK = re.compile(r"\s*(>|([-*+]|\d+[.)])\s)")
+
+# Markdown line patterns used to find complete blocks in a streamed response.
+CODE_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+CLOSING_CODE_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})[ \t]*$")
+LIST_ITEM = re.compile(r" {0,3}([-*+]|\d+[.)])(\s|$)")
+
+_console = None
+_spinner = Spinner()
 _receiving_response = False
 _stop_response = False
 
@@ -41,13 +60,83 @@ class ChatArgs(Args):
     model: str
 
 
-def sigint_handler(*_):
+def plain_output(args: Args) -> bool:
+    """Return True if markdown should be printed as plain text.
+
+    Markdown is not rendered when stdout is redirected to a file or pipe.
+    """
+    return args.plain or not sys.stdout.isatty()
+
+
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def sigint_handler(_signum, _frame) -> None:
     """Handle SIGINT (Ctrl+C) to stop the response."""
-    global _receiving_response, _stop_response
+    global _stop_response
     if _receiving_response:
         _stop_response = True
 
 
+def sigterm_handler(signum, _frame) -> None:
+    """Handle SIGTERM by exiting through the normal cleanup path."""
+    raise SystemExit(128 + signum)
+
+
+def write_buffer(fd: int, buffer: bytearray) -> None:
+    """Write the buffer to a file descriptor and clear it."""
+    while buffer:
+        del buffer[: os.write(fd, buffer)]
+
+
+def complete_blocks_length(markdown: str) -> int:
+    """Return the length of the leading complete markdown blocks.
+
+    Blocks end at a blank line outside a code fence, once the next line has
+    arrived and neither is indented nor starts a list item, either of which
+    could continue the block.
+    """
+    length = 0
+    position = 0
+    fence = ""
+    after_blank = False
+    for line in markdown.split("\n")[:-1]:
+        if fence:
+            match = CLOSING_CODE_FENCE.match(line)
+            if match and match[1][0] == fence[0] and len(match[1]) >= len(fence):
+                fence = ""
+        elif not line.strip():
+            after_blank = True
+        else:
+            if after_blank and not line[0].isspace() and not LIST_ITEM.match(line):
+                length = position
+            after_blank = False
+            match = CODE_FENCE.match(line)
+            if match:
+                fence = match[1]
+        position += len(line) + 1
+    return length
+
+
+def render_block(markdown: str, separate: bool) -> "RenderableType":
+    """Return a renderable for a markdown block printed after other blocks."""
+    from rich.console import Group
+    from rich.markdown import Markdown
+
+    if not markdown:
+        return Group()
+    if separate and not SELF_SPACED_BLOCK.match(markdown):
+        return Group("", Markdown(markdown))
+    return Markdown(markdown)
+
+
 def send(chat: Chat, user_input: str, args: ChatArgs) -> None:
     """Send a message to the model and print the response."""
     global _receiving_response, _stop_response
@@ -58,34 +147,57 @@ def send(chat: Chat, user_input: str, args: ChatArgs) -> None:
         response = chat.send(user_input)
 
         if args.plain:
-            spinner = Spinner()
-            for chunk in response:
-                spinner.stop()
-                if chunk:
-                    print(chunk, end="", flush=True)
-                if _stop_response:
-                    break
-            print()
+            # Bypass the text layer and write encoded chunks straight to the
+            # file descriptor in batches.
+            _spinner.start()
+            fd = sys.stdout.fileno()
+            encoding = sys.stdout.encoding
+            errors = sys.stdout.errors
+            buffer = bytearray()
+            for i, chunk in enumerate(filter(None, response)):
+                _spinner.stop()
+                buffer += chunk.encode(encoding, errors)
+                if (
+                    i % CHUNK_BATCH == 0
+                    or "\n" in chunk
+                    or len(buffer) >= WRITE_BUFFER_SIZE
+                ):
+                    write_buffer(fd, buffer)
+                    if _stop_response:
+                        break
+            write_buffer(fd, buffer)
+            _spinner.stop()
+            print(flush=True)
         else:
-            full_response = ""
-            with Live(console=Console(), refresh_per_second=20) as live:
+            from rich.live import Live
+            from rich.spinner import Spinner as RichSpinner
+
+            # Only the trailing, still incomplete block is re-rendered as chunks
+            # arrive. Complete blocks are printed once above the live display.
+            pending = ""
+            separate = False
+            with Live(console=get_console(), refresh_per_second=20) as live:
                 live.update(RichSpinner("dots"))
-                for chunk in response:
-                    if chunk:
-                        full_response += chunk
-                        live.update(Markdown(full_response))
-                    if _stop_response:
+                for i, chunk in enumerate(filter(None, response)):
+                    pending += chunk
+                    length = complete_blocks_length(pending)
+                    if length:
+                        live.console.print(render_block(pending[:length], separate))
+                        pending = pending[length:]
+                        separate = True
+                    live.update(render_block(pending, separate))
+                    if i % CHUNK_BATCH == 0 and _stop_response:
                         break
     finally:
+        _spinner.stop()
         _receiving_response = False
         _stop_response = False
 
 
-def save_chat(user_input: str, chat: Chat) -> None:
+def save_chat(parts: list[str], chat: Chat, _args: ChatArgs) -> None:
     """Save chat to a file."""
-    from .persistence import get_save_file_path, save_chat, save_file_exists
+    from .persistence import save_chat, try_resolve_save_path
 
-    parts = user_input.split()
     if len(parts) != 2:
         print("Usage:\n  /save <file>")
         return
@@ -99,9 +211,9 @@ def save_chat(user_input: str, chat: Chat) -> None:
         print("Invalid filename.")
         return
 
-    path = get_save_file_path(filename)
+    path, exists = try_resolve_save_path(filename)
     if (
-        save_file_exists(filename)
+        exists
         and input(f"File '{path}' already exists. Overwrite? (y/n) ").strip().lower()
         != "y"
     ):
@@ -114,11 +226,10 @@ def save_chat(user_input: str, chat: Chat) -> None:
         print(f"Error saving chat: {e}")
 
 
-def load_chat(user_input: str, chat: Chat, args: ChatArgs) -> None:
+def load_chat(parts: list[str], chat: Chat, args: ChatArgs) -> None:
     """Load chat from a file."""
     from .persistence import load_chat
 
-    parts = user_input.split()
     if len(parts) != 2:
         print("Usage:\n  /load <file>")
         return
@@ -140,14 +251,31 @@ def print_chat(chat: Chat, args: ChatArgs) -> None:
     if not chat.history:
         return
 
-    for message in chat.history:
-        if message.from_user():
-            print(f"\n[{chat.model}] >>> {message.content}")
-        else:
-            if args.plain:
-                print(message.content)
-            else:
-                Console().print(Markdown(message.content))
+    header = "\n" + get_prompt(chat)
+
+    if plain_output(args):
+        lines = [
+            header + message.content if message.from_user() else message.content
+            for message in chat.history
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return
+
+    from rich.console import Group
+    from rich.markdown import Markdown
+    from rich.text import Text
+
+    get_console().print(
+        Group(
+            *(
+                Text(header + message.content)
+                if message.from_user()
+                else Markdown(message.content)
+                for message in chat.history
+            )
+        )
+    )
 
 
 def print_help() -> None:
@@ -164,30 +292,53 @@ def print_help() -> None:
     )
 
 
+def exit_chat(_parts: list[str], _chat: Chat, _args: ChatArgs) -> None:
+    """Exit the chat session."""
+    raise EOFError
+
+
+def clear_chat(_parts: list[str], chat: Chat, _args: ChatArgs) -> None:
+    """Clear the chat history."""
+    chat.clear()
+    print("Cleared chat history.")
+
+
+def show_help(_parts: list[str], _chat: Chat, _args: ChatArgs) -> None:
+    """Show the available commands."""
+    print_help()
+
+
+COMMANDS: dict[str, Callable[[list[str], Chat, ChatArgs], None]] = {
+    "/bye": exit_chat,
+    "/clear": clear_chat,
+    "/load": load_chat,
+    "/save": save_chat,
+    "/?": show_help,
+    "/help": show_help,
+}
+
+
 def handle_command(user_input: str, chat: Chat, args: ChatArgs) -> None:
     """Handle an user command."""
-    command = user_input.split()[0]
-
-    if command == "/bye":
-        raise EOFError
-    elif command == "/clear":
-        chat.clear()
-        print("Cleared chat history.")
-    elif command == "/load":
-        load_chat(user_input, chat, args)
-    elif command == "/save":
-        save_chat(user_input, chat)
-    elif command == "/?" or command == "/help":
-        print_help()
+    parts = user_input.split()
+    command = COMMANDS.get(parts[0])
+
+    if command is None:
+        print(f"Unknown command: '{parts[0]}'. Type /? for help.")
     else:
-        print(f"Unknown command: '{command}'. Type /? for help.")
+        command(parts, chat, args)
 
     print()
 
 
-def get_user_input(chat: Chat) -> str:
+def get_prompt(chat: Chat) -> str:
+    """Return the input prompt for a chat."""
+    return f"[{chat.model}] >>> "
+
+
+def get_user_input(prompt: str) -> str:
     """Get user input."""
-    user_input = input(f"[{chat.model}] >>> ").strip()
+    user_input = input(prompt).strip()
 
     # Handle multi-line input.
     if user_input.startswith(MULTI_LINE_INPUT):
@@ -200,20 +351,24 @@ def get_user_input(chat: Chat) -> str:
             lines.append(line)
         user_input = "\n".join(lines).strip()
 
-    return user_input.strip()
+    return user_input
 
 
 def input_loop(chat: Chat, args: ChatArgs) -> None:
     """Run the input loop for the chat session."""
+    prompt = get_prompt(chat)
     while True:
         try:
-            user_input = get_user_input(chat).strip()
+            user_input = get_user_input(prompt)
             if not user_input:
                 continue
             if user_input.startswith("/"):
                 handle_command(user_input, chat, args)
                 continue
         except EOFError:
+            # Restore the default handler so Ctrl+C during shutdown exits at once.
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            sys.stdout.flush()
             break
 
         try:
@@ -232,69 +387,87 @@ def split_model(model: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
+def init_readline() -> None:
+    """Enable better line editing."""
+    import readline
+
+    readline.parse_and_bind("set editing-mode emacs")
+
+
 # chat command
 def chat(args: ChatArgs) -> None:
     """Start an interactive chat session."""
-    # Register SIGINT handler.
+    # Register signal handlers.
     signal.signal(signal.SIGINT, sigint_handler)
-
-    # Enable better line editing.
-    readline.parse_and_bind("set editing-mode emacs")
+    signal.signal(signal.SIGTERM, sigterm_handler)
 
     key, model = split_model(args.model)
 
-    spinner = Spinner()
+    # Set up line editing while the provider creates the chat.
+    readline_thread = threading.Thread(target=init_readline, daemon=True)
+    readline_thread.start()
+
+    from .providers.providers import get_provider
+
+    _spinner.start()
     try:
         chat = get_provider(key).create_chat(model)
     finally:
-        spinner.stop()
+        _spinner.stop()
 
+    readline_thread.join()
     input_loop(chat, args)
 
 
-def print_markdown(markdown: str, args: Args) -> None:
-    """Print a markdown string."""
-    if args.plain:
-        print(markdown)
-    else:
-        Console().print(Markdown(markdown))
+def print_markdown(blocks: Iterable[str], args: Args) -> None:
+    """Print markdown blocks as they are produced."""
+    plain = plain_output(args)
+    for i, block in enumerate(blocks):
+        if plain:
+            if i:
+                print()
+            print(block)
+        else:
+            get_console().print(render_block(block, i > 0))
+
 
+def iter_providers_models_markdown() -> Iterator[str]:
+    """Yield markdown blocks listing all available models, one per provider."""
+    from .providers.providers import get_sorted_providers
 
-def get_providers_models_list() -> str:
-    """Return a markdown string listing all available models."""
-    providers = get_providers()
+    providers = get_sorted_providers()
     if not providers:
         raise RuntimeError("No providers available")
 
-    markdown = "# Available Models"
+    yield "# Available Models"
 
-    for provider in sorted(providers, key=lambda p: p.name):
-        markdown += f"\n\n## {provider.name}"
+    for provider in providers:
+        header = f"## {provider.name}"
 
         if provider.api_key is None:
-            markdown += (
-                f"\n\nAPI key environment variable ({provider.api_key_name}) not set."
+            yield (
+                f"{header}\n\n"
+                f"API key environment variable ({provider.api_key_name}) not set."
             )
             continue
 
-        models = provider.models
+        models = provider.sorted_models
         if not models:
-            markdown += "\n\nNo models available."
+            yield f"{header}\n\nNo models available."
             continue
-        for model in sorted(models):
-            markdown += f"\n* {provider.key}:{model}"
-
-    return markdown
+        yield "\n* ".join([header, *(f"{provider.key}:{model}" for model in models)])
 
 
 # list command
 def list_models(args: Args) -> None:
     """List available models."""
-    print_markdown(get_providers_models_list(), args)
+    print_markdown(iter_providers_models_markdown(), args)
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments() -> "argparse.Namespace":
     """Parse the command-line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Chat with AI in the terminal.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -312,8 +485,28 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def parse_common_arguments(argv: list[str]) -> ChatArgs | Args | None:
+    """Parse the common command lines without argparse.
+
+    Returns None for anything else, including help requests and usage errors.
+    """
+    plain = argv[:1] == ["--plain"]
+    if plain:
+        argv = argv[1:]
+
+    if len(argv) == 2 and argv[0] == "chat" and not argv[1].startswith("-"):
+        return ChatArgs(argv[0], plain, argv[1])
+    if len(argv) == 1 and argv[0] in ("list", "version"):
+        return Args(argv[0], plain)
+    return None
+
+
 def get_args() -> ChatArgs | Args:
     """Parse the command-line arguments and return the appropriate Args object."""
+    common_args = parse_common_arguments(sys.argv[1:])
+    if common_args is not None:
+        return common_args
+
     args = parse_arguments()
     if args.command == "chat":
         return ChatArgs(args.command, args.plain, args.model)
@@ -329,8 +522,6 @@ def main() -> None:
     elif args.command == "list":
         list_models(args)
     elif args.command == "version":
-        from chai import __version__
-
         print(f"chai {__version__}")
     else:
         raise ValueError(f"Unknown command: {args.command}")
@@ -17,6 +17,7 @@ from .base.chat import Chat
 from .base.message import Message
 
 SAVE_DIR = Path.home() / ".chai"
+SAVE_BUFFER_SIZE = 65536
 
 
 def get_save_file_path(filename: str) -> Path:
@@ -39,9 +40,10 @@ def serialize_conversation(chat: Chat) -> dict[str, any]:
     }
 
 
-def save_file_exists(filename: str) -> bool:
-    """Check if a save file exists."""
-    return get_save_file_path(filename).exists()
+def try_resolve_save_path(filename: str) -> tuple[Path, bool]:
+    """Return the full path for a save file and whether it exists."""
+    path = get_save_file_path(filename)
+    return path, path.exists()
 
 
 def save_chat(chat: Chat, filename: str) -> Path:
@@ -52,7 +54,7 @@ def save_chat(chat: Chat, filename: str) -> Path:
     path = get_save_file_path(filename)
     ensure_save_dir()
 
-    with open(path, "w") as save_file:
+    with open(path, "w", buffering=SAVE_BUFFER_SIZE) as save_file:
         json.dump(serialize_conversation(chat), save_file, indent=4)
 
     return path
@@ -10,6 +10,8 @@
 # ANY KIND, either express or implied.  See the License for the specific language
 # governing permissions and limitations under the License.
 
+import functools
+
 from ..base.provider import Provider
 from .anthropic import AnthropicProvider
 from .google import GoogleProvider
@@ -29,6 +31,15 @@ def get_providers() -> list[Provider]:
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def get_sorted_providers() -> tuple[Provider, ...]:
+    """Return the available providers sorted by name.
+
+    The result is cached, so repeated calls share the same provider instances.
+    """
+    return tuple(sorted(get_providers(), key=lambda p: p.name))
+
+
 def get_provider(key: str) -> Provider:
     """Return the provider with the given key."""
     for provider in get_providers():
@@ -19,24 +19,40 @@ FRAMES_PER_SECOND = 10
 
 
 class Spinner:
+    """Terminal spinner that can be started and stopped repeatedly.
+
+    A single daemon thread animates the spinner and waits while it is stopped.
+    """
+
     def __init__(self):
-        self._running = True
-        self._thread = threading.Thread(target=self._spin)
-        self._thread.start()
+        self._running = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
 
     def _spin(self):
         """Animate the spinner."""
-        while self._running:
-            for char in itertools.cycle(SPINNER_CHARS):
-                if not self._running:
-                    return
-                print(f"\r{char} ", end="", flush=True)
-                time.sleep(1 / FRAMES_PER_SECOND)
+        for char in itertools.cycle(SPINNER_CHARS):
+            if not self._running.is_set():
+                self._idle.set()
+                self._running.wait()
+            print(f"\r{char} ", end="", flush=True)
+            time.sleep(1 / FRAMES_PER_SECOND)
+
+    def start(self):
+        """Start the spinner."""
+        if self._running.is_set():
+            return
+        self._idle.clear()
+        self._running.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._spin, daemon=True)
+            self._thread.start()
 
     def stop(self):
         """Stop the spinner."""
-        if not self._running:
+        if not self._running.is_set():
             return
-        self._running = False
-        self._thread.join()
+        self._running.clear()
+        self._idle.wait()
         print("\r", end="", flush=True)